@@ -5,6 +5,7 @@ from .filter import (
     filter_tl_faces_by_frames,
     filter_tl_faces_by_status,
     get_agents_slice_from_frames,
+    get_detached_slice,
     get_frames_slice_from_scenes,
     get_tl_faces_slice_from_frames,
 )
@@ -36,4 +37,5 @@ __all__ = [
     "get_frames_slice_from_scenes",
     "get_tl_faces_slice_from_frames",
     "get_agents_slice_from_frames",
+    "get_detached_slice",
 ]
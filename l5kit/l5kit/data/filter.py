@@ -167,3 +167,19 @@ def get_tl_faces_slice_from_frames(frame_a: np.ndarray, frame_b: Optional[np.nda
         frame_b = frame_a
     tl_faces_index_end = frame_b["traffic_light_faces_index_interval"][1]
     return slice(tl_faces_index_start, tl_faces_index_end)
+
+
+def get_detached_slice(array: np.ndarray, array_slice: slice) -> np.ndarray:
+    """
+    Slice an array and ensure the result doesn't share memory with it.
+    Slicing a zarr array already reads the data into a new np.ndarray, so only np.ndarray views are copied.
+
+    Args:
+        array (np.ndarray): the array to slice, can be numpy array or a zarr array
+        array_slice (slice): the slice to apply
+
+    Returns:
+        np.ndarray: the sliced data, owning its memory
+    """
+    sliced = array[array_slice]
+    return sliced.copy() if isinstance(array, np.ndarray) else sliced
@@ -1,11 +1,12 @@
 import bisect
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
+import zarr
 from zarr import convenience
 
-from ..data import ChunkedDataset, get_agents_slice_from_frames, get_frames_slice_from_scenes
+from ..data import ChunkedDataset, get_agents_slice_from_frames
 from ..kinematic import Perturbation
 from ..rasterization import Rasterizer
 from .ego import EgoDataset
@@ -46,7 +47,10 @@ class AgentDataset(EgoDataset):
         # store the valid agents indexes
         self.agents_indices = np.nonzero(agents_mask)[0]
         # this will be used to get the frame idx from the agent idx
-        self.cumulative_sizes_agents = self.dataset.frames["agent_index_interval"][:, 1]
+        # a plain list of ints makes bisect much faster than on a np.ndarray (no numpy scalar for each comparison)
+        agents_interval_ends = self.dataset.frames["agent_index_interval"][:, 1]
+        self.cumulative_sizes_agents_arr = np.asarray(agents_interval_ends, dtype=np.int64)
+        self.cumulative_sizes_agents = self.cumulative_sizes_agents_arr.tolist()
         self.agents_mask = agents_mask
 
     def load_agents_mask(self) -> np.ndarray:
@@ -93,7 +97,7 @@ class AgentDataset(EgoDataset):
                 raise ValueError("absolute value of index should not exceed dataset length")
             index = len(self) + index
 
-        index = self.agents_indices[index]
+        index = int(self.agents_indices[index])  # python int, so that bisect compares plain ints
         track_id = self.dataset.agents[index]["track_id"]
         frame_index = bisect.bisect_right(self.cumulative_sizes_agents, index)
         scene_index = bisect.bisect_right(self.cumulative_sizes, frame_index)
@@ -104,6 +108,24 @@ class AgentDataset(EgoDataset):
             state_index = frame_index - self.cumulative_sizes[scene_index - 1]
         return self.get_frame(scene_index, state_index, track_id=track_id)
 
+    def get_frames(self, indices: np.ndarray) -> List[dict]:
+        """
+        Differs from parent by iterating on agents and not AV. Frame and scene lookups are performed in a single call.
+        """
+        agents_indices = self.agents_indices[self._normalise_indices(indices)]
+        # read all track_ids in a single selection, instead of one agent (and zarr chunk) at a time
+        if isinstance(self.dataset.agents, zarr.Array):
+            track_ids = self.dataset.agents.get_coordinate_selection(agents_indices, fields="track_id")
+        else:
+            track_ids = self.dataset.agents["track_id"][agents_indices]
+
+        frame_indices = np.searchsorted(self.cumulative_sizes_agents_arr, agents_indices, side="right")
+        scene_indices, state_indices = self._resolve(frame_indices)
+        return [
+            self.get_frame(int(scene_index), int(state_index), track_id=track_id)
+            for track_id, scene_index, state_index in zip(track_ids, scene_indices, state_indices)
+        ]
+
     def get_scene_dataset(self, scene_index: int) -> "AgentDataset":
         """
         Differs from parent only in the return type.
@@ -113,7 +135,7 @@ class AgentDataset(EgoDataset):
         new_dataset = super(AgentDataset, self).get_scene_dataset(scene_index).dataset
 
         # filter agents_bool values
-        frame_interval = self.dataset.scenes[scene_index]["frame_index_interval"]
+        frame_interval = self.frame_intervals[scene_index]
         # ASSUMPTION: all agents_index are consecutive
         start_index = self.dataset.frames[frame_interval[0]]["agent_index_interval"][0]
         end_index = self.dataset.frames[frame_interval[1] - 1]["agent_index_interval"][1]
@@ -133,14 +155,26 @@ class AgentDataset(EgoDataset):
         Returns:
             np.ndarray: indices that can be used for indexing with __getitem__
         """
-        scenes = self.dataset.scenes
-        assert scene_idx < len(scenes), f"scene_idx {scene_idx} is over len {len(scenes)}"
-        frame_slice = get_frames_slice_from_scenes(scenes[scene_idx])
-        agent_slice = get_agents_slice_from_frames(*self.dataset.frames[frame_slice][[0, -1]])
+        scene_slice = self.get_scene_slice(scene_idx)
+        return np.arange(scene_slice.start, scene_slice.stop)
 
-        mask_valid_indices = (self.agents_indices >= agent_slice.start) * (self.agents_indices < agent_slice.stop)
-        indices = np.nonzero(mask_valid_indices)[0]
-        return indices
+    def get_scene_slice(self, scene_idx: int) -> slice:
+        """
+        Get the indices for the given scene as a slice. Same as get_scene_indices, but without allocating an array.
+        This works because agents_indices is sorted, so valid agents of a scene are consecutive.
+        Args:
+            scene_idx (int): index of the scene
+
+        Returns:
+            slice: indices that can be used for indexing with __getitem__
+        """
+        assert scene_idx < len(self.frame_intervals), f"scene_idx {scene_idx} is over len {len(self.frame_intervals)}"
+        frame_start, frame_end = self.frame_intervals[scene_idx]
+        frames = self.dataset.frames
+        agent_slice = get_agents_slice_from_frames(frames[frame_start], frames[frame_end - 1])
+
+        start, stop = np.searchsorted(self.agents_indices, (agent_slice.start, agent_slice.stop))
+        return slice(int(start), int(stop))
 
     def get_frame_indices(self, frame_idx: int) -> np.ndarray:
         """
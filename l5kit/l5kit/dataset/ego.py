@@ -1,6 +1,6 @@
 import bisect
 from functools import partial
-from typing import Optional, Tuple, cast
+from typing import List, Optional, Tuple, cast
 
 import numpy as np
 from torch.utils.data import Dataset
@@ -8,6 +8,7 @@ from torch.utils.data import Dataset
 from ..data import (
     ChunkedDataset,
     get_agents_slice_from_frames,
+    get_detached_slice,
     get_frames_slice_from_scenes,
     get_tl_faces_slice_from_frames,
 )
@@ -39,7 +40,12 @@ None if not desired
         self.dataset = zarr_dataset
         self.rasterizer = rasterizer
 
-        self.cumulative_sizes = self.dataset.scenes["frame_index_interval"][:, 1]
+        # read the scenes intervals once, instead of accessing the structured (possibly zarr) array for each frame
+        self.frame_intervals = np.ascontiguousarray(self.dataset.scenes["frame_index_interval"])
+        # a plain list of ints makes bisect much faster than on a np.ndarray (no numpy scalar for each comparison)
+        self.cumulative_sizes = self.frame_intervals[:, 1].astype(np.int64).tolist()
+        # same information as a np.ndarray, used to resolve several indices at once
+        self.cumulative_sizes_arr = np.asarray(self.cumulative_sizes, dtype=np.int64)
 
         # build a partial so we don't have to access cfg each time
         self.sample_function = partial(
@@ -65,32 +71,38 @@ None if not desired
         """
         return len(self.dataset.frames)
 
-    def get_frame(self, scene_index: int, state_index: int, track_id: Optional[int] = None) -> dict:
+    def get_frame(self, scene_index: int, state_index: int, track_id: Optional[int] = -1) -> dict:
         """
         A utility function to get the rasterisation and trajectory target for a given agent in a given frame
 
         Args:
             scene_index (int): the index of the scene in the zarr
             state_index (int): a relative frame index in the scene
-            track_id (Optional[int]): the agent to rasterize or None for the AV
+            track_id (Optional[int]): the agent to rasterize or -1 for the AV (None is also accepted)
         Returns:
             dict: the rasterised image, the target trajectory (position and yaw) along with their availability,
-            the 2D matrix to center that agent, the agent track (-1 if ego) and the timestamp
+            the 2D matrix to center that agent and its inverse, the agent track (-1 if ego) and the timestamp
 
         """
-        frames = self.dataset.frames[get_frames_slice_from_scenes(self.dataset.scenes[scene_index])]
-        data = self.sample_function(state_index, frames, self.dataset.agents, self.dataset.tl_faces, track_id)
+        frame_start, frame_end = self.frame_intervals[scene_index]
+        frames = self.dataset.frames[frame_start:frame_end]
+        # generate_agent_sample expects None for the AV, while we always return a number to avoid crashing torch
+        if track_id is None or track_id == -1:
+            selected_track_id, track_id = None, -1
+        else:
+            selected_track_id = track_id
+        data = self.sample_function(state_index, frames, self.dataset.agents, self.dataset.tl_faces, selected_track_id)
         # 0,1,C -> C,0,1
         image = data["image"].transpose(2, 0, 1)
 
-        target_positions = np.array(data["target_positions"], dtype=np.float32)
-        target_yaws = np.array(data["target_yaws"], dtype=np.float32)
+        # targets are already generated as float32, asarray doesn't copy them
+        target_positions = np.asarray(data["target_positions"], dtype=np.float32)
+        target_yaws = np.asarray(data["target_yaws"], dtype=np.float32)
 
-        history_positions = np.array(data["history_positions"], dtype=np.float32)
-        history_yaws = np.array(data["history_yaws"], dtype=np.float32)
+        history_positions = np.asarray(data["history_positions"], dtype=np.float32)
+        history_yaws = np.asarray(data["history_yaws"], dtype=np.float32)
 
-        timestamp = frames[state_index]["timestamp"]
-        track_id = np.int64(-1 if track_id is None else track_id)  # always a number to avoid crashing torch
+        timestamp = frames["timestamp"][state_index]  # field view first, to avoid building a record
 
         return {
             "image": image,
@@ -101,7 +113,8 @@ None if not desired
             "history_yaws": history_yaws,
             "history_availabilities": data["history_availabilities"],
             "world_to_image": data["world_to_image"],
-            "track_id": track_id,
+            "image_to_world": data["image_to_world"],
+            "track_id": np.int64(track_id),
             "timestamp": timestamp,
             "centroid": data["centroid"],
             "yaw": data["yaw"],
@@ -131,6 +144,53 @@ None if not desired
             state_index = index - self.cumulative_sizes[scene_index - 1]
         return self.get_frame(scene_index, state_index)
 
+    def _normalise_indices(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Vectorised version of the negative index handling performed in __getitem__
+
+        Args:
+            indices (np.ndarray): indices of the elements to retrieve, negative values count from the end
+
+        Returns:
+            np.ndarray: the same indices as non-negative int64 values
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if np.any(-indices > len(self)):
+            raise ValueError("absolute value of index should not exceed dataset length")
+        return np.where(indices < 0, indices + len(self), indices)
+
+    def _resolve(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorised version of the scene lookup performed in __getitem__
+
+        Args:
+            indices (np.ndarray): global frame indices
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: scene indices and state indices (relative to the scene)
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        scene_indices = np.searchsorted(self.cumulative_sizes_arr, indices, side="right")
+        scene_starts = np.where(scene_indices == 0, 0, self.cumulative_sizes_arr[np.maximum(scene_indices - 1, 0)])
+        return scene_indices, indices - scene_starts
+
+    def get_frames(self, indices: np.ndarray) -> List[dict]:
+        """
+        Get multiple elements at once, same as calling __getitem__ on each index.
+        Scene lookup is performed in a single call
+
+        Args:
+            indices (np.ndarray): indices of the elements to retrieve
+
+        Returns:
+            List[dict]: one element for each index, please look get_frame signature and docstring
+        """
+        scene_indices, state_indices = self._resolve(self._normalise_indices(indices))
+        return [
+            self.get_frame(int(scene_index), int(state_index))
+            for scene_index, state_index in zip(scene_indices, state_indices)
+        ]
+
     def get_scene_dataset(self, scene_index: int) -> "EgoDataset":
         """
         Returns another EgoDataset dataset where the underlying data can be modified.
@@ -144,14 +204,14 @@ None if not desired
 
         """
         # copy everything to avoid references (scene is already detached from zarr if get_combined_scene was called)
-        scenes = self.dataset.scenes[scene_index : scene_index + 1].copy()
+        scenes = get_detached_slice(self.dataset.scenes, slice(scene_index, scene_index + 1))
         frame_slice = get_frames_slice_from_scenes(*scenes)
-        frames = self.dataset.frames[frame_slice].copy()
+        frames = get_detached_slice(self.dataset.frames, frame_slice)
         agent_slice = get_agents_slice_from_frames(*frames[[0, -1]])
         tl_slice = get_tl_faces_slice_from_frames(*frames[[0, -1]])
 
-        agents = self.dataset.agents[agent_slice].copy()
-        tl_faces = self.dataset.tl_faces[tl_slice].copy()
+        agents = get_detached_slice(self.dataset.agents, agent_slice)
+        tl_faces = get_detached_slice(self.dataset.tl_faces, tl_slice)
 
         frames["agent_index_interval"] -= agent_slice.start
         frames["traffic_light_faces_index_interval"] -= tl_slice.start
@@ -175,9 +235,21 @@ None if not desired
         Returns:
             np.ndarray: indices that can be used for indexing with __getitem__
         """
-        scenes = self.dataset.scenes
-        assert scene_idx < len(scenes), f"scene_idx {scene_idx} is over len {len(scenes)}"
-        return np.arange(*scenes[scene_idx]["frame_index_interval"])
+        scene_slice = self.get_scene_slice(scene_idx)
+        return np.arange(scene_slice.start, scene_slice.stop)
+
+    def get_scene_slice(self, scene_idx: int) -> slice:
+        """
+        Get the indices for the given scene as a slice. Same as get_scene_indices, but without allocating an array.
+        Args:
+            scene_idx (int): index of the scene
+
+        Returns:
+            slice: indices that can be used for indexing with __getitem__
+        """
+        assert scene_idx < len(self.frame_intervals), f"scene_idx {scene_idx} is over len {len(self.frame_intervals)}"
+        frame_start, frame_end = self.frame_intervals[scene_idx]
+        return slice(int(frame_start), int(frame_end))
 
     def get_frame_indices(self, frame_idx: int) -> np.ndarray:
         """
@@ -1,11 +1,13 @@
-from .angle import angle_between_vectors, angular_distance, compute_yaw_around_north_from_direction
+from .angle import angle_between_vectors, angular_distance, angular_distances, compute_yaw_around_north_from_direction
 from .image import crop_rectangle_from_image
 from .transform import (
     ecef_to_geodetic,
     flip_y_axis,
     geodetic_to_ecef,
     get_transformation_matrix,
+    invert_affine_2d,
     rotation33_as_yaw,
+    rotations33_as_yaws,
     transform_point,
     transform_points,
     transform_points_transposed,
@@ -19,6 +21,7 @@ __all__ = [
     "compute_yaw_around_north_from_direction",
     "crop_rectangle_from_image",
     "rotation33_as_yaw",
+    "rotations33_as_yaws",
     "yaw_as_rotation33",
     "world_to_image_pixels_matrix",
     "flip_y_axis",
@@ -26,10 +29,12 @@ __all__ = [
     "transform_points_transposed",
     "transform_point",
     "get_transformation_matrix",
+    "invert_affine_2d",
     "ecef_to_geodetic",
     "geodetic_to_ecef",
     "points_within_bounds",
     "voxel_coords_to_intensity_grid",
     "normalize_intensity",
     "angular_distance",
+    "angular_distances",
 ]
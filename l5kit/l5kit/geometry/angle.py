@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Union, cast
 
 import numpy as np
 
@@ -45,3 +45,18 @@ def angular_distance(angle_a: float, angle_b: float) -> float:
     """
 
     return float((angle_a - angle_b + np.pi) % (2 * np.pi) - np.pi)
+
+
+def angular_distances(angles_a: np.ndarray, angles_b: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Vectorised version of angular_distance, return the angular distances (angles_a - angles_b) in radians.
+    The results are always in the [-pi, pi] range
+
+    Args:
+        angles_a (np.ndarray): first angles in radians
+        angles_b (Union[float, np.ndarray]): second angle(s) in radians, broadcastable to ``angles_a``
+
+    Returns:
+        np.ndarray: angular distances in radians
+    """
+    return (angles_a - angles_b + np.pi) % (2 * np.pi) - np.pi
@@ -17,6 +17,22 @@ def rotation33_as_yaw(rotation: np.ndarray) -> float:
     return cast(float, transforms3d.euler.mat2euler(rotation)[2])
 
 
+def rotations33_as_yaws(rotations: np.ndarray) -> np.ndarray:
+    """Compute the yaw component of multiple 3x3 rotation matrices at once.
+    Same as calling rotation33_as_yaw on each of them, without a Python loop.
+
+    Args:
+        rotations (np.ndarray): Nx3x3 rotation matrices (np.float64 dtype recommended)
+
+    Returns:
+        np.ndarray: N yaw rotations in radians
+    """
+    # sxyz convention as in transforms3d.euler.mat2euler, including its degenerate case
+    cos_pitch = np.hypot(rotations[:, 0, 0], rotations[:, 1, 0])
+    yaws = np.arctan2(rotations[:, 1, 0], rotations[:, 0, 0])
+    return np.where(cos_pitch > np.finfo(float).eps * 4.0, yaws, 0.0)
+
+
 def yaw_as_rotation33(yaw: float) -> np.ndarray:
     """Create a 3x3 rotation matrix from given yaw.
     The rotation is counter-clockwise and it is equivalent to:
@@ -111,8 +127,12 @@ def transform_points(points: np.ndarray, transf_matrix: np.ndarray) -> np.ndarra
     Returns:
         np.ndarray: array of shape (N,2) for 2D input points, or (N,3) points for 3D input points
     """
-    # TODO: Surely we can do this without transposing.
-    return transform_points_transposed(points.transpose(1, 0), transf_matrix).transpose(1, 0)
+    num_dims = transf_matrix.shape[0] - 1
+    if points.shape[1] not in [2, 3, 4]:
+        raise ValueError("Points input should be (N, 2), (N,3) or (N,4) shape, received {}".format(points.shape))
+
+    # apply the linear part and the translation directly, without building homogeneous coordinates
+    return points[:, :num_dims] @ transf_matrix[:num_dims, :num_dims].T + transf_matrix[:num_dims, num_dims]
 
 
 def transform_points_transposed(points: np.ndarray, transf_matrix: np.ndarray) -> np.ndarray:
@@ -126,11 +146,10 @@ def transform_points_transposed(points: np.ndarray, transf_matrix: np.ndarray) -
     Returns:
         np.ndarray: array of shape (2,N) for 2D input points, or (3,N) points for 3D input points
     """
-    num_dims = transf_matrix.shape[0] - 1
     if points.shape[0] not in [2, 3, 4]:
         raise ValueError("Points input should be (2, N), (3,N) or (4,N) shape, received {}".format(points.shape))
 
-    return transf_matrix.dot(np.vstack((points[:num_dims, :], np.ones(points.shape[1]))))[:num_dims, :]
+    return transform_points(points.transpose(1, 0), transf_matrix).transpose(1, 0)
 
 
 def transform_point(point: np.ndarray, transf_matrix: np.ndarray) -> np.ndarray:
@@ -147,6 +166,25 @@ def transform_point(point: np.ndarray, transf_matrix: np.ndarray) -> np.ndarray:
     return np.matmul(transf_matrix, point_ext)[: point.shape[0]]
 
 
+def invert_affine_2d(transf_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ Invert a 2D affine transformation in closed form.
+    Only the 2x2 linear part and the translation are used, so the last row is assumed to be [0,0,1].
+    This is much cheaper than np.linalg.inv on the full 3x3 matrix.
+
+    Args:
+        transf_matrix (np.ndarray): 3x3 transformation matrix
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the 2x2 linear part and the translation (2) of the inverse transformation
+    """
+    a, b, tx = transf_matrix[0]
+    c, d, ty = transf_matrix[1]
+    det = a * d - b * c
+    rotation_inv = np.array([[d, -b], [-c, a]]) / det
+    translation_inv = -rotation_inv @ np.array([tx, ty])
+    return rotation_inv, translation_inv
+
+
 def get_transformation_matrix(translation: np.ndarray, rotation: np.ndarray) -> np.ndarray:
     """
     Get a 3D transformation matrix from translation vector and quaternion rotation
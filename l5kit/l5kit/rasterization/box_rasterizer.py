@@ -7,7 +7,6 @@ from l5kit.data.zarr_dataset import AGENT_DTYPE
 
 from ..data.filter import filter_agents_by_labels, filter_agents_by_track_id
 from ..geometry import rotation33_as_yaw, transform_points, world_to_image_pixels_matrix
-from ..geometry.transform import yaw_as_rotation33
 from .rasterizer import EGO_EXTENT_HEIGHT, EGO_EXTENT_LENGTH, EGO_EXTENT_WIDTH, Rasterizer
 
 
@@ -53,14 +52,16 @@ def draw_boxes(
     else:
         im = np.zeros((raster_size[1], raster_size[0], 3), dtype=np.uint8)
 
-    box_world_coords = np.zeros((len(agents), 4, 2))
     corners_base_coords = np.asarray([[-1, -1], [-1, 1], [1, 1], [1, -1]])
 
-    # compute the corner in world-space (start in origin, rotate and then translate)
-    for idx, agent in enumerate(agents):
-        corners = corners_base_coords * agent["extent"][:2] / 2  # corners in zero
-        r_m = yaw_as_rotation33(agent["yaw"])
-        box_world_coords[idx] = transform_points(corners, r_m) + agent["centroid"][:2]
+    # compute the corner in world-space (start in origin, rotate and then translate) for all agents at once
+    corners = corners_base_coords[None] * agents["extent"][:, None, :2] / 2  # corners in zero, (N, 4, 2)
+    yaws = agents["yaw"].astype(np.float64)
+    cos_yaws, sin_yaws = np.cos(yaws)[:, None], np.sin(yaws)[:, None]
+    box_world_coords = np.empty((len(agents), 4, 2))
+    box_world_coords[..., 0] = cos_yaws * corners[..., 0] - sin_yaws * corners[..., 1]
+    box_world_coords[..., 1] = sin_yaws * corners[..., 0] + cos_yaws * corners[..., 1]
+    box_world_coords += agents["centroid"][:, None, :2]
 
     box_image_coords = transform_points(box_world_coords.reshape((-1, 2)), world_to_image_space)
 
@@ -123,9 +124,12 @@ class BoxRasterizer(Rasterizer):
         )
 
         # this ensures we always end up with fixed size arrays, +1 is because current time is also in the history
-        out_shape = (self.raster_size[1], self.raster_size[0], self.history_num_frames + 1)
-        agents_images = np.zeros(out_shape, dtype=np.uint8)
-        ego_images = np.zeros(out_shape, dtype=np.uint8)
+        num_history_channels = self.history_num_frames + 1
+        # the image consists of [agent_t, agent_t-1, agent_t-2, ego_t, ego_t-1, ego_t-2]
+        # we draw directly in the final array to avoid allocating and concatenating the two halves
+        out_im = np.zeros((self.raster_size[1], self.raster_size[0], 2 * num_history_channels), dtype=np.uint8)
+        agents_images = out_im[..., :num_history_channels]
+        ego_images = out_im[..., num_history_channels:]
 
         for i, (frame, agents) in enumerate(zip(history_frames, history_agents)):
             agents = filter_agents_by_labels(agents, self.filter_agents_threshold)
@@ -148,10 +152,9 @@ class BoxRasterizer(Rasterizer):
             agents_images[..., i] = agents_image
             ego_images[..., i] = ego_image
 
-        # combine such that the image consists of [agent_t, agent_t-1, agent_t-2, ego_t, ego_t-1, ego_t-2]
-        out_im = np.concatenate((agents_images, ego_images), -1)
-
-        return out_im.astype(np.float32) / 255
+        out_im_float = out_im.astype(np.float32)
+        out_im_float /= 255
+        return out_im_float
 
     def to_rgb(self, in_im: np.ndarray, **kwargs: dict) -> np.ndarray:
         """
@@ -3,7 +3,7 @@ from typing import List, Optional, Tuple
 import cv2
 import numpy as np
 
-from ..geometry import rotation33_as_yaw, transform_point, world_to_image_pixels_matrix
+from ..geometry import invert_affine_2d, rotation33_as_yaw, transform_point, world_to_image_pixels_matrix
 from .rasterizer import Rasterizer
 from .satellite_image import get_sat_image_crop_scaled
 
@@ -70,7 +70,8 @@ class SatelliteRasterizer(Rasterizer):
         # get the center of the images in meters using the inverse of the matrix,
         # Transform it to satellite coordinates (consider also z here)
         center_pixel = np.asarray(self.raster_size) * (0.5, 0.5)
-        world_translation = transform_point(center_pixel, np.linalg.inv(world_to_image_space))
+        image_to_world_rotation, image_to_world_translation = invert_affine_2d(world_to_image_space)
+        world_translation = image_to_world_rotation @ center_pixel + image_to_world_translation
         sat_translation = transform_point(np.append(world_translation, ego_translation[2]), self.world_to_aerial)
 
         # Note 1: there is a negation here, unknown why this is necessary.
@@ -87,7 +88,9 @@ class SatelliteRasterizer(Rasterizer):
 
         # Here we flip the Y axis as Y+ should to the left of ego
         sat_im = sat_im[::-1]
-        return sat_im.astype(np.float32) / 255
+        sat_im = sat_im.astype(np.float32)
+        sat_im /= 255  # in place to avoid another allocation
+        return sat_im
 
     def to_rgb(self, in_im: np.ndarray, **kwargs: dict) -> np.ndarray:
         return (in_im * 255).astype(np.uint8)
@@ -6,7 +6,7 @@ import numpy as np
 
 from ..data.filter import filter_tl_faces_by_status
 from ..data.map_api import MapAPI
-from ..geometry import rotation33_as_yaw, transform_point, transform_points, world_to_image_pixels_matrix
+from ..geometry import invert_affine_2d, rotation33_as_yaw, transform_points, world_to_image_pixels_matrix
 from .rasterizer import Rasterizer
 
 # sub-pixel drawing precision constants
@@ -142,10 +142,13 @@ class SemanticRasterizer(Rasterizer):
 
         # get XY of center pixel in world coordinates
         center_pixel = np.asarray(self.raster_size) * (0.5, 0.5)
-        center_world = transform_point(center_pixel, np.linalg.inv(world_to_image_space))
+        image_to_world_rotation, image_to_world_translation = invert_affine_2d(world_to_image_space)
+        center_world = image_to_world_rotation @ center_pixel + image_to_world_translation
 
         sem_im = self.render_semantic_map(center_world, world_to_image_space, history_tl_faces[0])
-        return sem_im.astype(np.float32) / 255
+        sem_im = sem_im.astype(np.float32)
+        sem_im /= 255  # in place to avoid another allocation
+        return sem_im
 
     def render_semantic_map(
         self, center_world: np.ndarray, world_to_image_space: np.ndarray, tl_faces: np.ndarray
@@ -7,10 +7,17 @@ from ..data import (
     filter_agents_by_labels,
     filter_tl_faces_by_frames,
     get_agents_slice_from_frames,
+    get_detached_slice,
     get_tl_faces_slice_from_frames,
 )
 from ..data.filter import filter_agents_by_frames, filter_agents_by_track_id
-from ..geometry import angular_distance, rotation33_as_yaw, world_to_image_pixels_matrix
+from ..geometry import (
+    angular_distances,
+    invert_affine_2d,
+    rotation33_as_yaw,
+    rotations33_as_yaws,
+    world_to_image_pixels_matrix,
+)
 from ..kinematic import Perturbation
 from ..rasterization import EGO_EXTENT_HEIGHT, EGO_EXTENT_LENGTH, EGO_EXTENT_WIDTH, Rasterizer
 from .slicing import get_future_slice, get_history_slice
@@ -67,7 +74,8 @@ to train models that can recover from slight divergence from training set data
 
     Returns:
         dict: a dict object with the raster array, the future offset coordinates (meters),
-        the future yaw angular offset, the future_availability as a binary mask
+        the future yaw angular offset, the future_availability as a binary mask, the world_to_image matrix
+        and its inverse
     """
     #  the history slice is ordered starting from the latest frame and goes backward in time., ex. slice(100, 91, -2)
     history_slice = get_history_slice(state_index, history_num_frames, history_step_size, include_current_state=True)
@@ -80,7 +88,7 @@ to train models that can recover from slight divergence from training set data
 
     # get agents (past and future)
     agent_slice = get_agents_slice_from_frames(sorted_frames[0], sorted_frames[-1])
-    agents = agents[agent_slice].copy()  # this is the minimum slice of agents we need
+    agents = get_detached_slice(agents, agent_slice)  # this is the minimum slice of agents we need
     history_frames["agent_index_interval"] -= agent_slice.start  # sync interval with the agents array
     future_frames["agent_index_interval"] -= agent_slice.start  # sync interval with the agents array
     history_agents = filter_agents_by_frames(history_frames, agents)
@@ -90,7 +98,7 @@ to train models that can recover from slight divergence from training set data
         tl_slice = get_tl_faces_slice_from_frames(history_frames[-1], history_frames[0])  # -1 is the farthest
         # sync interval with the traffic light faces array
         history_frames["traffic_light_faces_index_interval"] -= tl_slice.start
-        history_tl_faces = filter_tl_faces_by_frames(history_frames, tl_faces[tl_slice].copy())
+        history_tl_faces = filter_tl_faces_by_frames(history_frames, get_detached_slice(tl_faces, tl_slice))
     except ValueError:
         history_tl_faces = [np.empty(0, dtype=TL_FACE_DTYPE) for _ in history_frames]
 
@@ -135,6 +143,9 @@ to train models that can recover from slight divergence from training set data
         ego_yaw_rad=agent_yaw,
         ego_center_in_image_ratio=ego_center,
     )
+    # closed form inverse, so that users don't have to invert the matrix for each sample
+    image_to_world_space = np.eye(3)
+    image_to_world_space[:2, :2], image_to_world_space[:2, 2] = invert_affine_2d(world_to_image_space)
 
     future_coords_offset, future_yaws_offset, future_availability = _create_targets_for_deep_prediction(
         future_num_frames, future_frames, selected_track_id, future_agents, agent_centroid[:2], agent_yaw,
@@ -154,6 +165,7 @@ to train models that can recover from slight divergence from training set data
         "history_yaws": history_yaws_offset,
         "history_availabilities": history_availability,
         "world_to_image": world_to_image_space,
+        "image_to_world": image_to_world_space,
         "centroid": agent_centroid,
         "yaw": agent_yaw,
         "extent": agent_extent,
@@ -190,22 +202,31 @@ def _create_targets_for_deep_prediction(
     yaws_offset = np.zeros((num_frames, 1), dtype=np.float32)
     availability = np.zeros((num_frames,), dtype=np.float32)
 
-    for i, (frame, agents) in enumerate(zip(frames, agents)):
-        if selected_track_id is None:
-            agent_centroid = frame["ego_translation"][:2]
-            agent_yaw = rotation33_as_yaw(frame["ego_rotation"])
-        else:
-            # it's not guaranteed the target will be in every frame
-            try:
-                agent = filter_agents_by_track_id(agents, selected_track_id)[0]
-            except IndexError:
-                availability[i] = 0.0  # keep track of invalid futures/history
-                continue
-
-            agent_centroid = agent["centroid"]
-            agent_yaw = agent["yaw"]
-
-        coords_offset[i] = agent_centroid - agent_current_centroid
-        yaws_offset[i] = angular_distance(agent_yaw, agent_current_yaw)
-        availability[i] = 1.0
+    if selected_track_id is None:
+        # the AV is always available, so all offsets can be computed at once from the frames
+        num_available = min(len(frames), len(agents))
+        yaws = rotations33_as_yaws(frames["ego_rotation"][:num_available])
+        coords_offset[:num_available] = frames["ego_translation"][:num_available, :2] - agent_current_centroid
+        yaws_offset[:num_available, 0] = angular_distances(yaws, agent_current_yaw)
+        availability[:num_available] = 1.0
+        return coords_offset, yaws_offset, availability
+
+    # only look up the agent in each frame, offsets are then computed for all available steps at once
+    available_steps = []
+    agent_centroids = []
+    agent_yaws = []
+    for i, frame_agents in enumerate(agents[: len(frames)]):
+        agent_indices = np.flatnonzero(frame_agents["track_id"] == selected_track_id)
+        if len(agent_indices) == 0:  # it's not guaranteed the target will be in every frame
+            continue
+        agent = frame_agents[agent_indices[0]]
+        available_steps.append(i)
+        agent_centroids.append(agent["centroid"])
+        agent_yaws.append(agent["yaw"])
+
+    if len(available_steps) > 0:
+        yaws = np.asarray(agent_yaws, dtype=np.float64)
+        coords_offset[available_steps] = np.asarray(agent_centroids) - agent_current_centroid
+        yaws_offset[available_steps, 0] = angular_distances(yaws, agent_current_yaw)
+        availability[available_steps] = 1.0
     return coords_offset, yaws_offset, availability
@@ -5,6 +5,7 @@ from l5kit.data import (
     ChunkedDataset,
     filter_agents_by_frames,
     get_agents_slice_from_frames,
+    get_detached_slice,
     get_frames_slice_from_scenes,
     get_tl_faces_slice_from_frames,
 )
@@ -75,3 +76,13 @@ def test_get_tl_faces_slice_from_frames(slice_end: int, zarr_dataset: ChunkedDat
         frame_a["traffic_light_faces_index_interval"][0] : frame_b["traffic_light_faces_index_interval"][1]
     ]
     assert np.all(tl_faces_new == tl_faces)
+
+
+def test_get_detached_slice(zarr_dataset: ChunkedDataset) -> None:
+    frames = zarr_dataset.frames[0:10]
+    frames_slice = get_detached_slice(frames, slice(2, 5))
+    assert not np.shares_memory(frames_slice, frames)
+    assert frames_slice["timestamp"].tolist() == frames[2:5]["timestamp"].tolist()
+
+    agents_slice = get_detached_slice(zarr_dataset.agents, slice(0, 10))  # zarr source
+    assert len(agents_slice) == 10
@@ -1,10 +1,10 @@
-from typing import Callable
+from typing import Callable, Optional
 
 import numpy as np
 import pytest
 from torch.utils.data import DataLoader, Dataset, Subset
 
-from l5kit.data import ChunkedDataset, LocalDataManager
+from l5kit.data import ChunkedDataset, LocalDataManager, get_agents_slice_from_frames, get_frames_slice_from_scenes
 from l5kit.dataset import AgentDataset, EgoDataset
 from l5kit.rasterization import StubRasterizer, build_rasterizer
 
@@ -18,6 +18,7 @@ def check_sample(cfg: dict, dataset: Dataset) -> None:
         assert len(el["target_yaws"]) == cfg["model_params"]["future_num_frames"]
         assert len(el["target_availabilities"]) == cfg["model_params"]["future_num_frames"]
         assert el["world_to_image"].shape == (3, 3)
+        assert el["image_to_world"].shape == (3, 3)
 
 
 def check_torch_loading(dataset: Dataset) -> None:
@@ -60,6 +61,26 @@ def test_scene_index_interval(dataset_cls: Callable, scene_idx: int, zarr_datase
         pass
 
 
+@pytest.mark.parametrize("dataset_cls", [EgoDataset, AgentDataset])
+def test_scene_slice(dataset_cls: Callable, zarr_dataset: ChunkedDataset, cfg: dict) -> None:
+    rasterizer = StubRasterizer((100, 100), np.asarray((0.25, 0.25)), np.asarray((0.5, 0.5)), 0)
+    dataset = dataset_cls(cfg, zarr_dataset, rasterizer, None)
+    frame_slice = get_frames_slice_from_scenes(zarr_dataset.scenes[0])
+    if dataset_cls is EgoDataset:
+        expected_indices = np.arange(frame_slice.start, frame_slice.stop)
+    else:
+        agent_slice = get_agents_slice_from_frames(*zarr_dataset.frames[frame_slice][[0, -1]])
+        agents_indices = dataset.agents_indices
+        expected_indices = np.nonzero((agents_indices >= agent_slice.start) * (agents_indices < agent_slice.stop))[0]
+
+    scene_slice = dataset.get_scene_slice(0)
+    np.testing.assert_array_equal(np.arange(scene_slice.start, scene_slice.stop), expected_indices)
+    np.testing.assert_array_equal(dataset.get_scene_indices(0), expected_indices)
+
+    with pytest.raises(AssertionError):
+        dataset.get_scene_slice(len(zarr_dataset.scenes))
+
+
 @pytest.mark.parametrize("history_num_frames", [1, 2, 3, 4])
 @pytest.mark.parametrize("dataset_cls", [EgoDataset, AgentDataset])
 def test_non_zero_history(
@@ -75,3 +96,32 @@ def test_non_zero_history(
     for idx in indexes:
         data = dataset[idx]
         assert data["image"].shape == (2 * (history_num_frames + 1), *rast_params["raster_size"])
+
+
+@pytest.mark.parametrize("dataset_cls", [EgoDataset, AgentDataset])
+def test_get_frames(dataset_cls: Callable, zarr_dataset: ChunkedDataset, cfg: dict) -> None:
+    rasterizer = StubRasterizer((100, 100), np.asarray((0.25, 0.25)), np.asarray((0.5, 0.5)), 0)
+    dataset = dataset_cls(cfg, zarr_dataset, rasterizer, None)
+    indices = np.asarray([0, 1, 10, len(dataset) - 1, -1, -len(dataset)], dtype=np.int64)
+
+    for index, el in zip(indices, dataset.get_frames(indices)):
+        expected = dataset[index]
+        assert el["timestamp"] == expected["timestamp"]
+        assert el["track_id"] == expected["track_id"]
+        np.testing.assert_array_equal(el["target_positions"], expected["target_positions"])
+
+    with pytest.raises(ValueError):
+        dataset.get_frames(np.asarray([-len(dataset) - 1]))
+
+
+@pytest.mark.parametrize("track_id", [-1, None])
+def test_get_frame_av_track_id(track_id: Optional[int], zarr_dataset: ChunkedDataset, cfg: dict) -> None:
+    rasterizer = StubRasterizer((100, 100), np.asarray((0.25, 0.25)), np.asarray((0.5, 0.5)), 0)
+    dataset = EgoDataset(cfg, zarr_dataset, rasterizer, None)
+
+    el = dataset.get_frame(0, 5, track_id=track_id)
+    expected = dataset.get_frame(0, 5)
+    assert el["track_id"] == -1
+    assert isinstance(el["track_id"], np.int64)
+    np.testing.assert_array_equal(el["target_positions"], expected["target_positions"])
+    np.testing.assert_array_equal(el["centroid"], expected["centroid"])
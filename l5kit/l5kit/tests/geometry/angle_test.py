@@ -1,8 +1,9 @@
 from math import degrees, radians
 
+import numpy as np
 import pytest
 
-from l5kit.geometry import angular_distance
+from l5kit.geometry import angular_distance, angular_distances
 
 
 def test_angular_distance() -> None:
@@ -33,3 +34,10 @@ def test_angular_distance() -> None:
     assert -20 == pytest.approx(degrees(angular_distance(radians(170.0), radians(-170 + 3 * 360))), 1e-3)
     assert -20 == pytest.approx(degrees(angular_distance(radians(170.0 + 5 * 360), radians(-170))), 1e-3)
     assert -20 == pytest.approx(degrees(angular_distance(radians(170.0 - 5 * 360), radians(-170))), 1e-3)
+
+
+def test_angular_distances() -> None:
+    angles_a = np.radians([30.0, 170.0, -90.0])
+    angles_b = np.radians([0.0, -170.0, 150.0])
+    expected = [angular_distance(angle_a, angle_b) for angle_a, angle_b in zip(angles_a, angles_b)]
+    np.testing.assert_almost_equal(angular_distances(angles_a, angles_b), expected)
@@ -2,7 +2,15 @@ import numpy as np
 import pytest
 import transforms3d
 
-from l5kit.geometry import transform_point, transform_points, transform_points_transposed, world_to_image_pixels_matrix
+from l5kit.geometry import (
+    invert_affine_2d,
+    rotation33_as_yaw,
+    rotations33_as_yaws,
+    transform_point,
+    transform_points,
+    transform_points_transposed,
+    world_to_image_pixels_matrix,
+)
 
 
 def test_transform_to_image_space_2d() -> None:
@@ -67,3 +75,20 @@ def test_wrong_input_shape() -> None:
     with pytest.raises(ValueError):
         points = np.zeros((10, 3))
         transform_points_transposed(points, tf)
+
+
+def test_invert_affine_2d() -> None:
+    tf = world_to_image_pixels_matrix((200, 100), np.asarray((0.5, 0.25)), np.asarray((10.0, -3.0)), 0.7)
+    tf_inv = np.linalg.inv(tf)
+
+    rotation_inv, translation_inv = invert_affine_2d(tf)
+    np.testing.assert_almost_equal(rotation_inv, tf_inv[:2, :2])
+    np.testing.assert_almost_equal(translation_inv, tf_inv[:2, 2])
+
+
+def test_rotations33_as_yaws() -> None:
+    rotations = np.stack(
+        [transforms3d.euler.euler2mat(np.random.rand(), np.random.rand(), np.random.rand()) for _ in range(10)]
+    )
+    yaws = rotations33_as_yaws(rotations)
+    np.testing.assert_almost_equal(yaws, [rotation33_as_yaw(rotation) for rotation in rotations])
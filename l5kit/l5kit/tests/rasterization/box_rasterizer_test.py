@@ -27,6 +27,19 @@ def test_draw_boxes() -> None:
     assert im.sum() == (21 * 21) * 2
 
 
+def test_draw_boxes_rotated() -> None:
+    agents = np.zeros(1, dtype=AGENT_DTYPE)
+    agents[0]["extent"] = (40, 10, 10)
+    agents[0]["centroid"] = (100, 100)
+    agents[0]["yaw"] = np.pi / 2
+
+    to_image_space = np.eye(3)
+    im = draw_boxes((200, 200), to_image_space, agents, color=1)
+    # the box is rotated by 90 degrees, so it's taller than wide
+    rows, cols = np.nonzero(im)
+    assert rows.max() - rows.min() > cols.max() - cols.min()
+
+
 @pytest.fixture(scope="module")
 def hist_data(zarr_dataset: ChunkedDataset) -> tuple:
     hist_frames = zarr_dataset.frames[100:111][::-1]  # reverse to get them as history
@@ -77,3 +77,4 @@ def test_future(zarr_dataset: ChunkedDataset, cfg: dict) -> None:
         assert isinstance(data["yaw"], float)
         assert data["extent"].shape == (3,)
         assert bool(np.all(data["target_availabilities"])) is True
+        np.testing.assert_almost_equal(data["image_to_world"] @ data["world_to_image"], np.eye(3))